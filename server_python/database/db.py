@@ -1,27 +1,245 @@
 """
 Database module for SQLite operations
 """
+import asyncio
 import sqlite3
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import os
 from contextlib import contextmanager
+from functools import lru_cache
+from typing import List
+
 import logfire
+from pydantic import TypeAdapter
 
 
 DB_PATH = os.getenv("DB_PATH", Path(__file__).parent / "finance.db")
 
+# Routine lifecycle logs are only worth the overhead while debugging
+DEBUG = os.getenv("DEBUG", "").lower() in ("1", "true")
+
+# Pragmas that must be re-applied on every new connection (they are not
+# persisted in the database file, unlike journal_mode)
+CONNECTION_PRAGMAS = """
+    PRAGMA cache_size = -64000;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA busy_timeout = 5000;
+    PRAGMA foreign_keys = ON;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA mmap_size = 1073741824;
+"""
+
+
+def _is_memory_db() -> bool:
+    """Check whether we are running against an in-memory database"""
+    return str(DB_PATH) == ":memory:"
+
+
+# Bump whenever SCHEMA_SQL (or a migration) changes; stored in the database
+# via PRAGMA user_version so startup can skip DDL that already ran
+SCHEMA_VERSION = 6
+
+SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS categories (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        type TEXT NOT NULL CHECK(type IN ('income', 'expense')),
+        color TEXT NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE TABLE IF NOT EXISTS transactions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        amount REAL NOT NULL,
+        currency TEXT DEFAULT 'RON',
+        category_id INTEGER,
+        description TEXT,
+        date DATE NOT NULL,
+        is_recurring BOOLEAN DEFAULT 0,
+        recurrence_interval TEXT CHECK(recurrence_interval IN ('daily', 'weekly', 'monthly', 'yearly')),
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (category_id) REFERENCES categories(id)
+    );
+
+    CREATE TABLE IF NOT EXISTS budgets (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        category_id INTEGER NOT NULL,
+        amount REAL NOT NULL,
+        currency TEXT DEFAULT 'RON',
+        month INTEGER NOT NULL,
+        year INTEGER NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (category_id) REFERENCES categories(id),
+        UNIQUE(category_id, month, year)
+    );
+
+    CREATE TABLE IF NOT EXISTS bills (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        amount REAL NOT NULL,
+        currency TEXT DEFAULT 'RON',
+        due_date DATE NOT NULL,
+        category_id INTEGER,
+        is_recurring BOOLEAN DEFAULT 0,
+        recurrence_interval TEXT CHECK(recurrence_interval IN ('monthly', 'yearly')),
+        status TEXT DEFAULT 'pending' CHECK(status IN ('pending', 'paid')),
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (category_id) REFERENCES categories(id)
+    );
+
+    CREATE TABLE IF NOT EXISTS exchange_rates (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        currency_code TEXT NOT NULL,
+        rate REAL NOT NULL,
+        date DATE NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(currency_code, date)
+    );
+
+    CREATE TABLE IF NOT EXISTS currencies (
+        code TEXT PRIMARY KEY,
+        name TEXT NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS user_preferences (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        key TEXT NOT NULL UNIQUE,
+        value TEXT NOT NULL,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Uniqueness marker that lets the default-category seed run as a
+    -- plain INSERT OR IGNORE instead of a COUNT(*) check
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_categories_name_type ON categories(name, type);
+
+    -- Indexes covering the hot filter/join paths used by the routers
+    CREATE INDEX IF NOT EXISTS idx_bills_due ON bills(due_date, status);
+    CREATE INDEX IF NOT EXISTS idx_bills_category ON bills(category_id);
+    CREATE INDEX IF NOT EXISTS idx_budgets_year_month ON budgets(year, month);
+    CREATE INDEX IF NOT EXISTS idx_budgets_category ON budgets(category_id);
+    CREATE INDEX IF NOT EXISTS idx_transactions_category_date ON transactions(category_id, date);
+    CREATE INDEX IF NOT EXISTS idx_transactions_date_created ON transactions(date DESC, created_at DESC);
+
+    -- Default display currency preference
+    INSERT OR IGNORE INTO user_preferences (key, value)
+    VALUES ('display_currency', 'RON');
+"""
+
 
 @contextmanager
 def get_db():
     """Get database connection context manager"""
     conn = sqlite3.connect(DB_PATH)
     conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+    conn.executescript(CONNECTION_PRAGMAS)
     try:
         yield conn
     finally:
         conn.close()
 
 
+class ConnectionPool:
+    """
+    Bounded pool of long-lived SQLite connections: one writer plus a queue
+    of readers. Reusing connections keeps SQLite's page cache warm across
+    requests instead of discarding it on every open/close.
+    """
+
+    def __init__(self, max_readers: int = 4):
+        # SQLite allows one writer at a time, so a single shared writer
+        # connection guarded by a lock matches its concurrency model
+        self._writer = self._connect()
+        self._writer_lock = threading.Lock()
+
+        # A separate :memory: connection would open a brand-new empty
+        # database, so in-memory mode routes all reads to the writer too
+        self._readers = None
+        if not _is_memory_db():
+            self._readers = queue.Queue(maxsize=max_readers)
+            for _ in range(max_readers):
+                self._readers.put(self._connect(readonly=True))
+
+    def _connect(self, readonly: bool = False):
+        # Readers open the file mode=ro so SQLite never takes a write lock
+        # on their behalf and a stray write through a reader fails loudly
+        target = f"file:{DB_PATH}?mode=ro" if readonly else str(DB_PATH)
+        # A larger statement cache lets SQLite reuse compiled bytecode for
+        # the router queries instead of re-parsing them on every request
+        conn = sqlite3.connect(target, uri=readonly, check_same_thread=False,
+                               cached_statements=256)
+        # Autocommit: single-statement writes commit themselves without the
+        # implicit BEGIN + explicit commit() round-trip Python adds by default;
+        # multi-statement writes use the transaction() helper instead
+        conn.isolation_level = None
+        conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+        conn.executescript(CONNECTION_PRAGMAS)
+        return conn
+
+    @contextmanager
+    def get_reader(self):
+        """Check a read connection out of the pool"""
+        if self._readers is None:
+            with self.get_writer() as conn:
+                yield conn
+            return
+
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    @contextmanager
+    def get_writer(self):
+        """Get exclusive access to the single write connection"""
+        with self._writer_lock:
+            yield self._writer
+
+    def close(self):
+        """Close all pooled connections"""
+        if self._readers is not None:
+            while not self._readers.empty():
+                self._readers.get_nowait().close()
+        self._writer.close()
+
+
+_pool = None
+
+
+def init_pool(max_readers: int = 4):
+    """Initialize the shared connection pool (called from app startup)"""
+    global _pool
+    if _pool is not None:
+        # Drop cached cursors along with the connections they belong to;
+        # id() keys can otherwise collide with recycled addresses and hand
+        # out cursors bound to closed connections
+        _hot_cursors.clear()
+        _pool.close()
+    _pool = ConnectionPool(max_readers=max_readers)
+    if DEBUG:
+        logfire.info("Connection pool initialized", max_readers=max_readers)
+
+
+def close_pool():
+    """Close the shared connection pool (called from app shutdown)"""
+    global _pool
+    if _pool is not None:
+        _hot_cursors.clear()
+        _pool.close()
+        _pool = None
+
+
+def get_pool() -> ConnectionPool:
+    """Get the shared pool, creating it lazily for scripts that skip startup"""
+    global _pool
+    if _pool is None:
+        _pool = ConnectionPool()
+    return _pool
+
+
 def dict_from_row(row):
     """Convert sqlite3.Row to dictionary"""
     if row is None:
@@ -31,160 +249,278 @@ def dict_from_row(row):
 
 def init_database():
     """Initialize database with all tables"""
-    logfire.info("Initializing database")
     with get_db() as conn:
         cursor = conn.cursor()
-        
-        # Categories table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS categories (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                type TEXT NOT NULL CHECK(type IN ('income', 'expense')),
-                color TEXT NOT NULL,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Transactions table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS transactions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                amount REAL NOT NULL,
-                currency TEXT DEFAULT 'RON',
-                category_id INTEGER,
-                description TEXT,
-                date DATE NOT NULL,
-                is_recurring BOOLEAN DEFAULT 0,
-                recurrence_interval TEXT CHECK(recurrence_interval IN ('daily', 'weekly', 'monthly', 'yearly')),
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (category_id) REFERENCES categories(id)
-            )
-        """)
-        
-        # Check if currency column exists in transactions
-        cursor.execute("PRAGMA table_info(transactions)")
-        columns = [col[1] for col in cursor.fetchall()]
-        if 'currency' not in columns:
-            cursor.execute("ALTER TABLE transactions ADD COLUMN currency TEXT DEFAULT 'RON'")
-            logfire.info("Added currency column to transactions table")
-        
-        # Budgets table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS budgets (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                category_id INTEGER NOT NULL,
-                amount REAL NOT NULL,
-                currency TEXT DEFAULT 'RON',
-                month INTEGER NOT NULL,
-                year INTEGER NOT NULL,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (category_id) REFERENCES categories(id),
-                UNIQUE(category_id, month, year)
-            )
-        """)
-        
-        # Bills table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS bills (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                amount REAL NOT NULL,
-                currency TEXT DEFAULT 'RON',
-                due_date DATE NOT NULL,
-                category_id INTEGER,
-                is_recurring BOOLEAN DEFAULT 0,
-                recurrence_interval TEXT CHECK(recurrence_interval IN ('monthly', 'yearly')),
-                status TEXT DEFAULT 'pending' CHECK(status IN ('pending', 'paid')),
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (category_id) REFERENCES categories(id)
-            )
-        """)
-        
-        # Exchange rates table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS exchange_rates (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                currency_code TEXT NOT NULL,
-                rate REAL NOT NULL,
-                date DATE NOT NULL,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE(currency_code, date)
-            )
-        """)
-        
-        # User preferences table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS user_preferences (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                key TEXT NOT NULL UNIQUE,
-                value TEXT NOT NULL,
-                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Insert default display currency preference
-        cursor.execute("""
-            INSERT OR IGNORE INTO user_preferences (key, value) 
-            VALUES ('display_currency', 'RON')
-        """)
-        
-        # Insert default categories if none exist (not in test mode)
-        if os.getenv("ENV") != "test":
-            cursor.execute("SELECT COUNT(*) as count FROM categories")
-            count = cursor.fetchone()[0]
-            
-            if count == 0:
-                default_categories = [
-                    ('Salary', 'income', '#10b981'),
-                    ('Freelance', 'income', '#059669'),
-                    ('Groceries', 'expense', '#ef4444'),
-                    ('Utilities', 'expense', '#f59e0b'),
-                    ('Rent', 'expense', '#8b5cf6'),
-                    ('Transportation', 'expense', '#3b82f6'),
-                    ('Entertainment', 'expense', '#ec4899'),
-                    ('Healthcare', 'expense', '#14b8a6'),
-                    ('Dining Out', 'expense', '#f97316'),
-                    ('Other', 'expense', '#6b7280')
-                ]
-                
+
+        # WAL lets readers run concurrently with the writer; meaningless
+        # for an in-memory database, so skip it there. page_size must be
+        # set before the first write and only takes effect on a fresh
+        # database file (8 KiB pages mean fewer mmap page faults).
+        if not _is_memory_db():
+            cursor.execute("PRAGMA page_size = 8192")
+            cursor.execute("PRAGMA journal_mode = WAL")
+
+        # Fast path: schema is already at the current version, skip the DDL
+        version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        if version == SCHEMA_VERSION:
+            return
+
+        # v3 migration: the unique (name, type) index below cannot be
+        # created while legacy duplicate categories exist (nothing stopped
+        # the API from creating them before the index). Repoint references
+        # to the oldest row of each duplicate group and drop the rest.
+        if version < 3 and cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'categories'"
+        ).fetchone():
+            dupes = cursor.execute(
+                """SELECT c.id, keep.id
+                   FROM categories c
+                   JOIN (SELECT MIN(id) as id, name, type
+                         FROM categories GROUP BY name, type) keep
+                     ON keep.name = c.name AND keep.type = c.type AND c.id != keep.id"""
+            ).fetchall()
+            if dupes:
+                remap = [(keep_id, dupe_id) for dupe_id, keep_id in dupes]
+                dupe_ids = [(dupe_id,) for dupe_id, _ in dupes]
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.executemany(
+                    "UPDATE transactions SET category_id = ? WHERE category_id = ?", remap
+                )
+                cursor.executemany(
+                    "UPDATE bills SET category_id = ? WHERE category_id = ?", remap
+                )
+                # The kept category may already hold a budget for the same
+                # month; OR IGNORE keeps that one and the leftover rows
+                # still pointing at a duplicate are dropped as duplicates
                 cursor.executemany(
-                    "INSERT INTO categories (name, type, color) VALUES (?, ?, ?)",
-                    default_categories
+                    "UPDATE OR IGNORE budgets SET category_id = ? WHERE category_id = ?", remap
                 )
-                logfire.info("Default categories created", count=len(default_categories))
-        
+                cursor.executemany("DELETE FROM budgets WHERE category_id = ?", dupe_ids)
+                cursor.executemany("DELETE FROM categories WHERE id = ?", dupe_ids)
+                cursor.execute("COMMIT")
+                logfire.info("Deduplicated legacy categories", removed=len(dupes))
+
+        if DEBUG:
+            logfire.info("Initializing database", from_version=version)
+        conn.executescript(SCHEMA_SQL)
+
+        # v2 migration: older databases predate the transactions.currency
+        # column (and pre-versioning databases report version 0, so probe)
+        if version < 2:
+            cursor.execute("PRAGMA table_info(transactions)")
+            columns = [col[1] for col in cursor.fetchall()]
+            if 'currency' not in columns:
+                cursor.execute("ALTER TABLE transactions ADD COLUMN currency TEXT DEFAULT 'RON'")
+                logfire.info("Added currency column to transactions table")
+
+        # v5 migration: the (date DESC, created_at DESC) index supersedes
+        # the plain date index for both range filters and the
+        # recent-transactions sort, so v4 databases drop the old one
+        if version == 4:
+            cursor.execute("DROP INDEX IF EXISTS idx_transactions_date")
+
+        # Seed default categories (not in test mode): INSERT OR IGNORE
+        # against the unique (name, type) index is a no-op for categories
+        # that already exist, so no COUNT(*) scan is needed
+        if os.getenv("ENV") != "test":
+            default_categories = [
+                ('Salary', 'income', '#10b981'),
+                ('Freelance', 'income', '#059669'),
+                ('Groceries', 'expense', '#ef4444'),
+                ('Utilities', 'expense', '#f59e0b'),
+                ('Rent', 'expense', '#8b5cf6'),
+                ('Transportation', 'expense', '#3b82f6'),
+                ('Entertainment', 'expense', '#ec4899'),
+                ('Healthcare', 'expense', '#14b8a6'),
+                ('Dining Out', 'expense', '#f97316'),
+                ('Other', 'expense', '#6b7280')
+            ]
+
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.executemany(
+                "INSERT OR IGNORE INTO categories (name, type, color) VALUES (?, ?, ?)",
+                default_categories
+            )
+            cursor.execute("COMMIT")
+
+        # Seed currency display names (reference data, so not gated on
+        # test mode); edits become data changes rather than code changes
+        currency_names = [
+            ('RON', 'Romanian Leu'),
+            ('USD', 'US Dollar'),
+            ('EUR', 'Euro'),
+            ('GBP', 'British Pound'),
+            ('CHF', 'Swiss Franc'),
+            ('JPY', 'Japanese Yen'),
+            ('CAD', 'Canadian Dollar'),
+            ('AUD', 'Australian Dollar'),
+            ('CNY', 'Chinese Yuan'),
+            ('SEK', 'Swedish Krona'),
+            ('NOK', 'Norwegian Krone'),
+            ('DKK', 'Danish Krone'),
+            ('PLN', 'Polish Zloty'),
+            ('HUF', 'Hungarian Forint'),
+            ('CZK', 'Czech Koruna'),
+            ('BGN', 'Bulgarian Lev'),
+            ('TRY', 'Turkish Lira'),
+            ('RUB', 'Russian Ruble'),
+            ('INR', 'Indian Rupee'),
+            ('BRL', 'Brazilian Real'),
+            ('ZAR', 'South African Rand'),
+            ('MXN', 'Mexican Peso')
+        ]
+
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.executemany(
+            "INSERT OR IGNORE INTO currencies (code, name) VALUES (?, ?)",
+            currency_names
+        )
+        cursor.execute("COMMIT")
+
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         conn.commit()
-        logfire.info("Database initialized successfully")
+        if DEBUG:
+            logfire.info("Database initialized successfully", version=SCHEMA_VERSION)
+
+
+# Long-lived cursors per (connection, SQL text). On top of SQLite's own
+# statement cache this skips allocating a fresh Cursor object per call
+# for queries that repeat on every request. Keyed by id() because
+# sqlite3.Connection does not allow arbitrary attributes; entries are
+# dropped in close_pool() together with the connections they belong to.
+_HOT_CURSOR_LIMIT = 32
+_hot_cursors = {}
+
+
+def _hot_cursor(conn, query: str):
+    """Get a reusable cursor for this connection/query pair"""
+    cursors = _hot_cursors.setdefault(id(conn), {})
+    cursor = cursors.get(query)
+    if cursor is None:
+        if len(cursors) >= _HOT_CURSOR_LIMIT:
+            cursors.clear()
+        cursor = conn.cursor()
+        cursors[query] = cursor
+    return cursor
 
 
 def execute_query(query: str, params: tuple = (), fetch_one: bool = False):
     """Execute a query and return results"""
-    with get_db() as conn:
-        cursor = conn.cursor()
+    with get_pool().get_reader() as conn:
+        cursor = _hot_cursor(conn, query)
         cursor.execute(query, params)
-        
+
         if fetch_one:
             row = cursor.fetchone()
             return dict_from_row(row)
-        
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+
+        # Resolve column names once and build each dict via zip (both
+        # C-level) instead of dict(Row), which re-walks keys per row
+        keys = [d[0] for d in cursor.description]
+        return [dict(zip(keys, row)) for row in cursor.fetchall()]
+
+
+def iter_query(query: str, params: tuple = (), chunk: int = 256):
+    """Iterate over query results in chunks instead of materializing them all"""
+    with get_pool().get_reader() as conn:
+        cursor = conn.execute(query, params)
+        keys = [d[0] for d in cursor.description]
+        while True:
+            rows = cursor.fetchmany(chunk)
+            if not rows:
+                return
+            for row in rows:
+                yield dict(zip(keys, row))
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model_cls):
+    """Get a cached TypeAdapter validating a whole list of model_cls"""
+    return TypeAdapter(List[model_cls])
+
+
+def execute_query_models(query: str, params: tuple, model_cls):
+    """Execute a query and validate rows directly into Pydantic models"""
+    with get_pool().get_reader() as conn:
+        cursor = _hot_cursor(conn, query)
+        cursor.execute(query, params)
+        # Resolve column names once per query rather than once per row,
+        # then batch-validate the whole list in pydantic-core
+        keys = [d[0] for d in cursor.description]
+        rows = [dict(zip(keys, row)) for row in cursor.fetchall()]
+        return _list_adapter(model_cls).validate_python(rows)
 
 
 def execute_insert(query: str, params: tuple = ()):
     """Execute an insert query and return the last row id"""
-    with get_db() as conn:
-        cursor = conn.cursor()
+    with get_pool().get_writer() as conn:
+        cursor = _hot_cursor(conn, query)
         cursor.execute(query, params)
-        conn.commit()
         return cursor.lastrowid
 
 
 def execute_update(query: str, params: tuple = ()):
     """Execute an update/delete query and return the number of affected rows"""
-    with get_db() as conn:
-        cursor = conn.cursor()
+    with get_pool().get_writer() as conn:
+        cursor = _hot_cursor(conn, query)
         cursor.execute(query, params)
-        conn.commit()
         return cursor.rowcount
+
+
+def execute_write_returning(query: str, params: tuple = ()):
+    """Execute a write with a RETURNING clause and return the resulting row"""
+    with get_pool().get_writer() as conn:
+        cursor = _hot_cursor(conn, query)
+        cursor.execute(query, params)
+        return dict_from_row(cursor.fetchone())
+
+
+# Dedicated executors keep SQLite I/O off the event loop: fsyncs on the
+# single writer thread no longer stall unrelated requests, and the
+# writer's one-thread executor lines up with the pool's single writer
+# connection
+_writer_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-writer")
+_reader_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="sqlite-reader")
+
+
+async def aexecute_query(query: str, params: tuple = (), fetch_one: bool = False):
+    """Async execute_query, run on the reader thread pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_reader_executor, execute_query, query, params, fetch_one)
+
+
+async def aexecute_query_models(query: str, params: tuple, model_cls):
+    """Async execute_query_models, run on the reader thread pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_reader_executor, execute_query_models, query, params, model_cls)
+
+
+async def aexecute_insert(query: str, params: tuple = ()):
+    """Async execute_insert, run on the dedicated writer thread"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_writer_executor, execute_insert, query, params)
+
+
+async def aexecute_update(query: str, params: tuple = ()):
+    """Async execute_update, run on the dedicated writer thread"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_writer_executor, execute_update, query, params)
+
+
+async def aexecute_write_returning(query: str, params: tuple = ()):
+    """Async execute_write_returning, run on the dedicated writer thread"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_writer_executor, execute_write_returning, query, params)
+
+
+@contextmanager
+def transaction():
+    """Run multiple writes atomically on the writer connection"""
+    with get_pool().get_writer() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
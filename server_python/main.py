@@ -4,7 +4,7 @@ Main application entry point
 """
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from contextlib import asynccontextmanager
 import uvicorn
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -12,7 +12,7 @@ from dotenv import load_dotenv
 import os
 import logfire
 
-from database.db import init_database
+from database.db import init_database, init_pool, close_pool
 from routers import categories, transactions, budgets, bills, dashboard, currency
 from services.currency_service import update_exchange_rates
 
@@ -35,7 +35,11 @@ async def lifespan(app: FastAPI):
     # Startup
     logfire.info("Starting up Finance API...")
     init_database()
-    
+    # Cap readers per worker so the combined pools across WEB_CONCURRENCY
+    # worker processes don't pile up more SQLite readers than cores
+    workers = int(os.getenv("WEB_CONCURRENCY", "4"))
+    init_pool(max_readers=max(2, (os.cpu_count() or 4) // workers))
+
     # Update exchange rates on startup
     try:
         await update_exchange_rates()
@@ -58,6 +62,7 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     scheduler.shutdown()
+    close_pool()
     logfire.info("Shutting down Finance API...")
 
 
@@ -66,12 +71,18 @@ app = FastAPI(
     title="Personal Finance API",
     description="API for managing personal finances with multi-currency support",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson serializes the list endpoints several times faster than stdlib json
+    default_response_class=ORJSONResponse
 )
 
-# Instrument FastAPI with Logfire
+# Instrument FastAPI with Logfire; skip span creation for the trivial
+# endpoints where instrumentation would dominate the handler's own cost
 try:
-    logfire.instrument_fastapi(app)
+    logfire.instrument_fastapi(
+        app,
+        excluded_urls=["/api/health", "/api/categories/.*"]
+    )
     logfire.info("FastAPI instrumentation enabled")
 except Exception as e:
     logfire.warn("FastAPI instrumentation not available, continuing without it", error=str(e))
@@ -129,9 +140,14 @@ async def root():
 
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 5000))
+    # Multiple workers give true parallel reads against the WAL database;
+    # auto-reload is incompatible with workers, so it stays a dev-only mode
+    reload = os.getenv("ENV") == "development"
+    workers = int(os.getenv("WEB_CONCURRENCY", "4"))
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=port,
-        reload=True
+        workers=1 if reload else workers,
+        reload=reload
     )
@@ -1,7 +1,7 @@
 """
 Pydantic models for request/response validation
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Literal
 from datetime import date, datetime
 
@@ -25,8 +25,7 @@ class Category(CategoryBase):
     id: int
     created_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Transaction models
@@ -55,8 +54,7 @@ class Transaction(TransactionBase):
     category_type: Optional[str] = None
     category_color: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Budget models
@@ -82,8 +80,7 @@ class Budget(BudgetBase):
     category_name: Optional[str] = None
     category_color: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BudgetWithSpending(Budget):
@@ -117,8 +114,7 @@ class Bill(BillBase):
     category_name: Optional[str] = None
     category_color: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Dashboard models
@@ -2,48 +2,93 @@
 Bills API Router
 """
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
+from datetime import date, timedelta
+import orjson
 
 from models.schemas import Bill, BillCreate, BillUpdate, MessageResponse
-from database.db import execute_query, execute_insert, execute_update
+from database.db import aexecute_query, aexecute_update, aexecute_write_returning, iter_query
+from services.category_cache import get_category_lookup
 
 router = APIRouter()
 
+# Precompiled SQL for each filter combination, keyed by
+# (has_status, has_upcoming). Using the same constant string per variant
+# keeps each one hot in the per-connection statement cache instead of
+# rebuilding (and re-parsing) the SQL on every request.
+# Project only the columns the Bill response model serializes; SELECT *
+# would also decode created_at into a Python string just to drop it
+BILL_COLUMNS = "id, name, amount, currency, due_date, category_id, is_recurring, recurrence_interval, status"
+
+BILLS_SQL = {
+    (has_status, has_upcoming): (
+        f"SELECT {BILL_COLUMNS} FROM bills b WHERE 1=1"
+        + (" AND b.status = ?" if has_status else "")
+        + (" AND b.due_date BETWEEN ? AND ?" if has_upcoming else "")
+        + " ORDER BY b.due_date ASC"
+    )
+    for has_status in (False, True)
+    for has_upcoming in (False, True)
+}
+
 
 @router.get("/", response_model=List[Bill])
-async def get_bills(status: Optional[str] = None, upcoming: Optional[bool] = None):
-    """Get all bills with optional filters"""
-    sql = """
-        SELECT b.*, c.name as category_name, c.color as category_color
-        FROM bills b
-        LEFT JOIN categories c ON b.category_id = c.id
-        WHERE 1=1
-    """
+async def get_bills(
+    status: Optional[str] = None,
+    upcoming: Optional[bool] = None,
+    stream: Optional[bool] = None
+):
+    """Get all bills with optional filters (stream=true returns NDJSON)"""
     params = []
-    
+
     if status:
-        sql += " AND b.status = ?"
         params.append(status)
-    
+
     if upcoming:
-        sql += ' AND date(b.due_date) BETWEEN date("now") AND date("now", "+7 days")'
-    
-    sql += " ORDER BY b.due_date ASC"
-    
-    bills = execute_query(sql, tuple(params))
+        # Bind the window as plain ISO dates: date('now') would be
+        # re-evaluated per row and wrapping due_date in date() would
+        # keep the planner off the (due_date, status) index
+        today = date.today()
+        params.extend([today.isoformat(), (today + timedelta(days=7)).isoformat()])
+
+    sql = BILLS_SQL[(bool(status), bool(upcoming))]
+
+    if stream:
+        # Stream rows in fetchmany() chunks so large result sets never
+        # sit fully materialized in memory
+        def generate():
+            lookup = get_category_lookup()
+            for bill in iter_query(sql, tuple(params)):
+                bill["category_name"], bill["category_color"] = lookup.get(
+                    bill["category_id"], (None, None)
+                )
+                yield orjson.dumps(bill) + b"\n"
+
+        return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+    bills = await aexecute_query(sql, tuple(params))
+
+    # Categories are effectively static, so decorate from the cached
+    # lookup instead of LEFT JOINing categories on every request
+    lookup = get_category_lookup()
+    for bill in bills:
+        bill["category_name"], bill["category_color"] = lookup.get(
+            bill["category_id"], (None, None)
+        )
+
     return bills
 
 
 @router.get("/{bill_id}", response_model=Bill)
 async def get_bill(bill_id: int):
     """Get bill by ID"""
-    sql = """
-        SELECT b.*, c.name as category_name
+    sql = f"""
+        SELECT {BILL_COLUMNS}, (SELECT name FROM categories WHERE id = b.category_id) as category_name
         FROM bills b
-        LEFT JOIN categories c ON b.category_id = c.id
         WHERE b.id = ?
     """
-    bill = execute_query(sql, (bill_id,), fetch_one=True)
+    bill = await aexecute_query(sql, (bill_id,), fetch_one=True)
     
     if not bill:
         raise HTTPException(status_code=404, detail="Bill not found")
@@ -57,80 +102,76 @@ async def create_bill(bill: BillCreate):
     sql = """
         INSERT INTO bills (name, amount, currency, due_date, category_id, is_recurring, recurrence_interval, status)
         VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        RETURNING *,
+            (SELECT name FROM categories WHERE id = category_id) as category_name,
+            (SELECT color FROM categories WHERE id = category_id) as category_color
     """
-    bill_id = execute_insert(
-        sql,
-        (
-            bill.name,
-            bill.amount,
-            bill.currency,
-            bill.due_date,
-            bill.category_id,
-            bill.is_recurring,
-            bill.recurrence_interval,
-            bill.status
+    try:
+        created = await aexecute_write_returning(
+            sql,
+            (
+                bill.name,
+                bill.amount,
+                bill.currency,
+                bill.due_date,
+                bill.category_id,
+                bill.is_recurring,
+                bill.recurrence_interval,
+                bill.status
+            )
         )
-    )
-    
-    return {
-        "id": bill_id,
-        "name": bill.name,
-        "amount": bill.amount,
-        "currency": bill.currency,
-        "due_date": bill.due_date,
-        "category_id": bill.category_id,
-        "is_recurring": bill.is_recurring,
-        "recurrence_interval": bill.recurrence_interval,
-        "status": bill.status
-    }
+    except Exception as e:
+        if "FOREIGN KEY constraint failed" in str(e):
+            raise HTTPException(status_code=400, detail="Category does not exist")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return created
 
 
 @router.put("/{bill_id}", response_model=Bill)
 async def update_bill(bill_id: int, bill: BillUpdate):
     """Update a bill"""
     sql = """
-        UPDATE bills 
+        UPDATE bills
         SET name = ?, amount = ?, currency = ?, due_date = ?, category_id = ?, is_recurring = ?, recurrence_interval = ?, status = ?
         WHERE id = ?
+        RETURNING *,
+            (SELECT name FROM categories WHERE id = category_id) as category_name,
+            (SELECT color FROM categories WHERE id = category_id) as category_color
     """
-    rows_affected = execute_update(
-        sql,
-        (
-            bill.name,
-            bill.amount,
-            bill.currency,
-            bill.due_date,
-            bill.category_id,
-            bill.is_recurring,
-            bill.recurrence_interval,
-            bill.status,
-            bill_id
+    try:
+        updated = await aexecute_write_returning(
+            sql,
+            (
+                bill.name,
+                bill.amount,
+                bill.currency,
+                bill.due_date,
+                bill.category_id,
+                bill.is_recurring,
+                bill.recurrence_interval,
+                bill.status,
+                bill_id
+            )
         )
-    )
-    
-    if rows_affected == 0:
+    except Exception as e:
+        if "FOREIGN KEY constraint failed" in str(e):
+            raise HTTPException(status_code=400, detail="Category does not exist")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    if not updated:
         raise HTTPException(status_code=404, detail="Bill not found")
-    
-    return {
-        "id": bill_id,
-        "name": bill.name,
-        "amount": bill.amount,
-        "currency": bill.currency,
-        "due_date": bill.due_date,
-        "category_id": bill.category_id,
-        "is_recurring": bill.is_recurring,
-        "recurrence_interval": bill.recurrence_interval,
-        "status": bill.status
-    }
+
+    return updated
 
 
 @router.patch("/{bill_id}/pay", response_model=MessageResponse)
 async def mark_bill_paid(bill_id: int):
     """Mark bill as paid"""
-    sql = 'UPDATE bills SET status = "paid" WHERE id = ?'
-    rows_affected = execute_update(sql, (bill_id,))
-    
-    if rows_affected == 0:
+    sql = 'UPDATE bills SET status = "paid" WHERE id = ? RETURNING id'
+    paid = await aexecute_write_returning(sql, (bill_id,))
+
+    if not paid:
         raise HTTPException(status_code=404, detail="Bill not found")
     
     return {"message": "Bill marked as paid"}
@@ -140,7 +181,7 @@ async def mark_bill_paid(bill_id: int):
 async def delete_bill(bill_id: int):
     """Delete a bill"""
     sql = "DELETE FROM bills WHERE id = ?"
-    rows_affected = execute_update(sql, (bill_id,))
+    rows_affected = await aexecute_update(sql, (bill_id,))
     
     if rows_affected == 0:
         raise HTTPException(status_code=404, detail="Bill not found")
@@ -5,45 +5,61 @@ from fastapi import APIRouter, HTTPException
 from typing import List, Optional
 
 from models.schemas import Budget, BudgetCreate, BudgetUpdate, BudgetWithSpending, MessageResponse
-from database.db import execute_query, execute_insert, execute_update
+from database.db import aexecute_query, aexecute_query_models, aexecute_update, aexecute_write_returning
+from services.category_cache import get_category_lookup
 
 router = APIRouter()
 
+# Precompiled per-filter SQL variants over an explicit column
+# projection, keyed by (has_month, has_year); rationale in bills.py
+BUDGET_COLUMNS = "id, category_id, amount, currency, month, year"
+
+BUDGETS_SQL = {
+    (has_month, has_year): (
+        f"SELECT {BUDGET_COLUMNS} FROM budgets b WHERE 1=1"
+        + (" AND b.month = ?" if has_month else "")
+        + (" AND b.year = ?" if has_year else "")
+    )
+    for has_month in (False, True)
+    for has_year in (False, True)
+}
+
 
 @router.get("/", response_model=List[Budget])
 async def get_budgets(month: Optional[int] = None, year: Optional[int] = None):
     """Get all budgets with optional filters"""
-    sql = """
-        SELECT b.*, c.name as category_name, c.color as category_color
-        FROM budgets b
-        LEFT JOIN categories c ON b.category_id = c.id
-        WHERE 1=1
-    """
     params = []
-    
+
     if month is not None:
-        sql += " AND b.month = ?"
         params.append(month)
     if year is not None:
-        sql += " AND b.year = ?"
         params.append(year)
-    
-    sql += " ORDER BY c.name"
-    
-    budgets = execute_query(sql, tuple(params))
+
+    sql = BUDGETS_SQL[(month is not None, year is not None)]
+
+    budgets = await aexecute_query(sql, tuple(params))
+
+    # Categories are effectively static, so decorate from the cached
+    # lookup instead of LEFT JOINing categories on every request
+    lookup = get_category_lookup()
+    for budget in budgets:
+        budget["category_name"], budget["category_color"] = lookup.get(
+            budget["category_id"], (None, None)
+        )
+
+    budgets.sort(key=lambda b: b["category_name"] or "")
     return budgets
 
 
 @router.get("/{budget_id}", response_model=Budget)
 async def get_budget(budget_id: int):
     """Get budget by ID"""
-    sql = """
-        SELECT b.*, c.name as category_name
+    sql = f"""
+        SELECT {BUDGET_COLUMNS}, (SELECT name FROM categories WHERE id = b.category_id) as category_name
         FROM budgets b
-        LEFT JOIN categories c ON b.category_id = c.id
         WHERE b.id = ?
     """
-    budget = execute_query(sql, (budget_id,), fetch_one=True)
+    budget = await aexecute_query(sql, (budget_id,), fetch_one=True)
     
     if not budget:
         raise HTTPException(status_code=404, detail="Budget not found")
@@ -54,40 +70,57 @@ async def get_budget(budget_id: int):
 @router.get("/spending/{month}/{year}", response_model=List[BudgetWithSpending])
 async def get_budget_with_spending(month: int, year: int):
     """Get budgets with spending for a specific month and year"""
+    # Compare t.date against plain month bounds instead of wrapping it in
+    # strftime(), so the (category_id, date) index stays usable
+    month_start = f"{year:04d}-{month:02d}-01"
+    next_month, next_year = (1, year + 1) if month == 12 else (month + 1, year)
+    month_end = f"{next_year:04d}-{next_month:02d}-01"
+
+    # Pre-aggregate the month's transactions per category once, then join
+    # the sums to budgets. The old budgets x transactions GROUP BY re-read
+    # every matching transaction row per budget before collapsing them.
     sql = """
-        SELECT 
+        WITH tx AS (
+            SELECT category_id, SUM(amount) as spent
+            FROM transactions
+            WHERE date >= ? AND date < ?
+            GROUP BY category_id
+        )
+        SELECT
             b.id,
             b.category_id,
             b.amount as budgeted,
             c.name as category_name,
             c.color as category_color,
-            COALESCE(SUM(t.amount), 0) as spent,
+            COALESCE(tx.spent, 0) as spent,
             b.month,
             b.year,
             b.currency,
             b.amount
         FROM budgets b
         LEFT JOIN categories c ON b.category_id = c.id
-        LEFT JOIN transactions t ON t.category_id = b.category_id 
-            AND strftime('%m', t.date) = printf('%02d', b.month)
-            AND strftime('%Y', t.date) = CAST(b.year AS TEXT)
-            AND c.type = 'expense'
+        LEFT JOIN tx ON tx.category_id = b.category_id AND c.type = 'expense'
         WHERE b.month = ? AND b.year = ?
-        GROUP BY b.id, b.category_id, b.amount, c.name, c.color, b.month, b.year
         ORDER BY c.name
     """
-    
-    budgets = execute_query(sql, (month, year))
+
+    budgets = await aexecute_query_models(sql, (month_start, month_end, month, year), BudgetWithSpending)
     return budgets
 
 
 @router.post("/", response_model=Budget, status_code=201)
 async def create_budget(budget: BudgetCreate):
     """Create a new budget"""
-    sql = "INSERT INTO budgets (category_id, amount, currency, month, year) VALUES (?, ?, ?, ?, ?)"
-    
+    sql = """
+        INSERT INTO budgets (category_id, amount, currency, month, year)
+        VALUES (?, ?, ?, ?, ?)
+        RETURNING *,
+            (SELECT name FROM categories WHERE id = category_id) as category_name,
+            (SELECT color FROM categories WHERE id = category_id) as category_color
+    """
+
     try:
-        budget_id = execute_insert(
+        created = await aexecute_write_returning(
             sql,
             (budget.category_id, budget.amount, budget.currency, budget.month, budget.year)
         )
@@ -97,45 +130,45 @@ async def create_budget(budget: BudgetCreate):
                 status_code=400,
                 detail="Budget already exists for this category and month"
             )
+        if "FOREIGN KEY constraint failed" in str(e):
+            raise HTTPException(status_code=400, detail="Category does not exist")
         raise HTTPException(status_code=500, detail=str(e))
-    
-    return {
-        "id": budget_id,
-        "category_id": budget.category_id,
-        "amount": budget.amount,
-        "currency": budget.currency,
-        "month": budget.month,
-        "year": budget.year
-    }
+
+    return created
 
 
 @router.put("/{budget_id}", response_model=Budget)
 async def update_budget(budget_id: int, budget: BudgetUpdate):
     """Update a budget"""
-    sql = "UPDATE budgets SET category_id = ?, amount = ?, currency = ?, month = ?, year = ? WHERE id = ?"
-    rows_affected = execute_update(
-        sql,
-        (budget.category_id, budget.amount, budget.currency, budget.month, budget.year, budget_id)
-    )
-    
-    if rows_affected == 0:
+    sql = """
+        UPDATE budgets
+        SET category_id = ?, amount = ?, currency = ?, month = ?, year = ?
+        WHERE id = ?
+        RETURNING *,
+            (SELECT name FROM categories WHERE id = category_id) as category_name,
+            (SELECT color FROM categories WHERE id = category_id) as category_color
+    """
+    try:
+        updated = await aexecute_write_returning(
+            sql,
+            (budget.category_id, budget.amount, budget.currency, budget.month, budget.year, budget_id)
+        )
+    except Exception as e:
+        if "FOREIGN KEY constraint failed" in str(e):
+            raise HTTPException(status_code=400, detail="Category does not exist")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    if not updated:
         raise HTTPException(status_code=404, detail="Budget not found")
-    
-    return {
-        "id": budget_id,
-        "category_id": budget.category_id,
-        "amount": budget.amount,
-        "currency": budget.currency,
-        "month": budget.month,
-        "year": budget.year
-    }
+
+    return updated
 
 
 @router.delete("/{budget_id}", response_model=MessageResponse)
 async def delete_budget(budget_id: int):
     """Delete a budget"""
     sql = "DELETE FROM budgets WHERE id = ?"
-    rows_affected = execute_update(sql, (budget_id,))
+    rows_affected = await aexecute_update(sql, (budget_id,))
     
     if rows_affected == 0:
         raise HTTPException(status_code=404, detail="Budget not found")
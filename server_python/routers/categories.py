@@ -5,7 +5,8 @@ from fastapi import APIRouter, HTTPException
 from typing import List
 
 from models.schemas import Category, CategoryCreate, CategoryUpdate, MessageResponse
-from database.db import execute_query, execute_insert, execute_update
+from database.db import aexecute_query, aexecute_update, aexecute_write_returning
+from services.category_cache import get_categories_cached, invalidate_categories
 
 router = APIRouter()
 
@@ -13,16 +14,14 @@ router = APIRouter()
 @router.get("/", response_model=List[Category])
 async def get_categories():
     """Get all categories"""
-    sql = "SELECT * FROM categories ORDER BY type, name"
-    categories = execute_query(sql)
-    return categories
+    return get_categories_cached()
 
 
 @router.get("/{category_id}", response_model=Category)
 async def get_category(category_id: int):
     """Get category by ID"""
     sql = "SELECT * FROM categories WHERE id = ?"
-    category = execute_query(sql, (category_id,), fetch_one=True)
+    category = await aexecute_query(sql, (category_id,), fetch_one=True)
     
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
@@ -33,41 +32,63 @@ async def get_category(category_id: int):
 @router.post("/", response_model=Category, status_code=201)
 async def create_category(category: CategoryCreate):
     """Create a new category"""
-    sql = "INSERT INTO categories (name, type, color) VALUES (?, ?, ?)"
-    category_id = execute_insert(sql, (category.name, category.type, category.color))
-    
-    return {
-        "id": category_id,
-        "name": category.name,
-        "type": category.type,
-        "color": category.color
-    }
+    sql = "INSERT INTO categories (name, type, color) VALUES (?, ?, ?) RETURNING *"
+
+    try:
+        created = await aexecute_write_returning(sql, (category.name, category.type, category.color))
+    except Exception as e:
+        if "UNIQUE constraint failed" in str(e):
+            raise HTTPException(
+                status_code=400,
+                detail="Category already exists with this name and type"
+            )
+        raise HTTPException(status_code=500, detail=str(e))
+    invalidate_categories()
+
+    return created
 
 
 @router.put("/{category_id}", response_model=Category)
 async def update_category(category_id: int, category: CategoryUpdate):
     """Update a category"""
-    sql = "UPDATE categories SET name = ?, type = ?, color = ? WHERE id = ?"
-    rows_affected = execute_update(sql, (category.name, category.type, category.color, category_id))
-    
-    if rows_affected == 0:
+    sql = "UPDATE categories SET name = ?, type = ?, color = ? WHERE id = ? RETURNING *"
+
+    try:
+        updated = await aexecute_write_returning(sql, (category.name, category.type, category.color, category_id))
+    except Exception as e:
+        if "UNIQUE constraint failed" in str(e):
+            raise HTTPException(
+                status_code=400,
+                detail="Category already exists with this name and type"
+            )
+        raise HTTPException(status_code=500, detail=str(e))
+
+    if not updated:
         raise HTTPException(status_code=404, detail="Category not found")
-    
-    return {
-        "id": category_id,
-        "name": category.name,
-        "type": category.type,
-        "color": category.color
-    }
+    invalidate_categories()
+
+    return updated
 
 
 @router.delete("/{category_id}", response_model=MessageResponse)
 async def delete_category(category_id: int):
     """Delete a category"""
     sql = "DELETE FROM categories WHERE id = ?"
-    rows_affected = execute_update(sql, (category_id,))
-    
+
+    try:
+        rows_affected = await aexecute_update(sql, (category_id,))
+    except Exception as e:
+        # With foreign keys enforced, deleting a referenced category is
+        # rejected by SQLite instead of orphaning its rows
+        if "FOREIGN KEY constraint failed" in str(e):
+            raise HTTPException(
+                status_code=400,
+                detail="Category is still in use by transactions, budgets or bills"
+            )
+        raise HTTPException(status_code=500, detail=str(e))
+
     if rows_affected == 0:
         raise HTTPException(status_code=404, detail="Category not found")
-    
+    invalidate_categories()
+
     return {"message": "Category deleted successfully"}
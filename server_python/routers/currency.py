@@ -8,11 +8,23 @@ from models.schemas import (
     CurrencyRates, CurrencyConvertRequest, CurrencyConvertResponse,
     CurrencyPreference, Currency, MessageResponse
 )
-from database.db import execute_query, execute_update
+from database.db import execute_query, aexecute_query, aexecute_update
 from services.currency_service import get_latest_rates, convert_currency, update_exchange_rates
 
 router = APIRouter()
 
+# Display names live in the seeded currencies table, so adding one is a
+# data change; loaded from SQLite once on first use, then held in memory
+_currency_names = None
+
+
+def _load_currency_names() -> dict:
+    global _currency_names
+    if _currency_names is None:
+        rows = execute_query("SELECT code, name FROM currencies")
+        _currency_names = {row["code"]: row["name"] for row in rows}
+    return _currency_names
+
 
 @router.get("/rates", response_model=CurrencyRates)
 async def get_rates():
@@ -60,7 +72,7 @@ async def convert(request: CurrencyConvertRequest):
 @router.get("/preference", response_model=CurrencyPreference)
 async def get_preference():
     """Get user's display currency preference"""
-    result = execute_query(
+    result = await aexecute_query(
         "SELECT value FROM user_preferences WHERE key = ?",
         ("display_currency",),
         fetch_one=True
@@ -80,7 +92,7 @@ async def set_preference(preference: CurrencyPreference):
         INSERT OR REPLACE INTO user_preferences (key, value, updated_at) 
         VALUES ('display_currency', ?, CURRENT_TIMESTAMP)
     """
-    execute_update(sql, (preference.displayCurrency,))
+    await aexecute_update(sql, (preference.displayCurrency,))
     
     return {
         "displayCurrency": preference.displayCurrency,
@@ -92,16 +104,19 @@ async def set_preference(preference: CurrencyPreference):
 async def trigger_update_rates():
     """Manually trigger exchange rate update (admin endpoint)"""
     try:
-        success = await update_exchange_rates()
-        if success:
-            rates_data = await get_latest_rates()
+        # update_exchange_rates returns the fetched payload, so there is no
+        # need for a second get_latest_rates round-trip just for the summary
+        result = await update_exchange_rates()
+        if result:
             return {
                 "message": "Exchange rates updated successfully",
-                "date": rates_data["date"],
-                "currencyCount": len(rates_data["rates"])
+                "date": result["date"],
+                "currencyCount": len(result["exchangeRates"])
             }
         else:
             raise HTTPException(status_code=500, detail="Failed to update exchange rates")
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -111,9 +126,10 @@ async def get_currencies():
     """Get available currencies list"""
     try:
         rates_data = await get_latest_rates()
+        names = _load_currency_names()
         currencies = [
-            {"code": code, "name": get_currency_name(code)}
-            for code in rates_data["rates"].keys()
+            {"code": code, "name": names.get(code, code)}
+            for code in rates_data["rates"]
         ]
         return currencies
     except Exception as e:
@@ -122,28 +138,4 @@ async def get_currencies():
 
 def get_currency_name(code: str) -> str:
     """Helper function to get currency names"""
-    currency_names = {
-        'RON': 'Romanian Leu',
-        'USD': 'US Dollar',
-        'EUR': 'Euro',
-        'GBP': 'British Pound',
-        'CHF': 'Swiss Franc',
-        'JPY': 'Japanese Yen',
-        'CAD': 'Canadian Dollar',
-        'AUD': 'Australian Dollar',
-        'CNY': 'Chinese Yuan',
-        'SEK': 'Swedish Krona',
-        'NOK': 'Norwegian Krone',
-        'DKK': 'Danish Krone',
-        'PLN': 'Polish Zloty',
-        'HUF': 'Hungarian Forint',
-        'CZK': 'Czech Koruna',
-        'BGN': 'Bulgarian Lev',
-        'TRY': 'Turkish Lira',
-        'RUB': 'Russian Ruble',
-        'INR': 'Indian Rupee',
-        'BRL': 'Brazilian Real',
-        'ZAR': 'South African Rand',
-        'MXN': 'Mexican Peso'
-    }
-    return currency_names.get(code, code)
+    return _load_currency_names().get(code, code)
@@ -6,59 +6,58 @@ from typing import List
 from datetime import datetime
 
 from models.schemas import DashboardSummary, SpendingByCategory, RecentTransaction
-from database.db import execute_query
+from database.db import aexecute_query
 
 router = APIRouter()
 
 
+def _month_bounds(year: int, month: int):
+    """ISO dates for the first day of the month and of the next month"""
+    next_month, next_year = (1, year + 1) if month == 12 else (month + 1, year)
+    return f"{year:04d}-{month:02d}-01", f"{next_year:04d}-{next_month:02d}-01"
+
+
 @router.get("/summary", response_model=DashboardSummary)
 async def get_dashboard_summary():
     """Get dashboard summary for current month"""
     current_date = datetime.now()
     current_month = current_date.month
     current_year = current_date.year
-    
-    # Total budget for current month
-    budget_sql = "SELECT COALESCE(SUM(amount), 0) as total FROM budgets WHERE month = ? AND year = ?"
-    budget_result = execute_query(budget_sql, (current_month, current_year), fetch_one=True)
-    total_budget = budget_result["total"] if budget_result else 0
-    
-    # Total spent this month
-    spent_sql = """
-        SELECT COALESCE(SUM(t.amount), 0) as total 
-        FROM transactions t
-        JOIN categories c ON t.category_id = c.id
-        WHERE c.type = 'expense' 
-        AND strftime('%m', t.date) = printf('%02d', ?)
-        AND strftime('%Y', t.date) = ?
-    """
-    spent_result = execute_query(spent_sql, (current_month, str(current_year)), fetch_one=True)
-    total_spent = spent_result["total"] if spent_result else 0
-    
-    # Upcoming bills (next 7 days)
-    upcoming_sql = """
-        SELECT COUNT(*) as count FROM bills 
-        WHERE status = 'pending' 
-        AND date(due_date) BETWEEN date('now') AND date('now', '+7 days')
-    """
-    upcoming_result = execute_query(upcoming_sql, fetch_one=True)
-    upcoming_bills = upcoming_result["count"] if upcoming_result else 0
-    
-    # Overdue bills
-    overdue_sql = """
-        SELECT COUNT(*) as count FROM bills 
-        WHERE status = 'pending' 
-        AND date(due_date) < date('now')
+
+    # Bind plain month bounds instead of strftime() so the spent subquery
+    # can range-scan the transactions date index rather than scanning all rows
+    month_start, month_end = _month_bounds(current_year, current_month)
+
+    # One statement with four scalar subqueries instead of four separate
+    # round-trips (4 prepares + 4 connection checkouts collapse to 1)
+    sql = """
+        SELECT
+            (SELECT COALESCE(SUM(amount), 0) FROM budgets
+             WHERE month = ? AND year = ?) as total_budget,
+            (SELECT COALESCE(SUM(t.amount), 0)
+             FROM transactions t
+             JOIN categories c ON t.category_id = c.id
+             WHERE c.type = 'expense'
+             AND t.date >= ? AND t.date < ?) as total_spent,
+            (SELECT COUNT(*) FROM bills
+             WHERE status = 'pending'
+             AND date(due_date) BETWEEN date('now') AND date('now', '+7 days')) as upcoming_bills,
+            (SELECT COUNT(*) FROM bills
+             WHERE status = 'pending'
+             AND date(due_date) < date('now')) as overdue_bills
     """
-    overdue_result = execute_query(overdue_sql, fetch_one=True)
-    overdue_bills = overdue_result["count"] if overdue_result else 0
-    
+    summary = await aexecute_query(
+        sql,
+        (current_month, current_year, month_start, month_end),
+        fetch_one=True
+    )
+
     return {
-        "totalBudget": total_budget,
-        "totalSpent": total_spent,
-        "remaining": total_budget - total_spent,
-        "upcomingBills": upcoming_bills,
-        "overdueBills": overdue_bills,
+        "totalBudget": summary["total_budget"],
+        "totalSpent": summary["total_spent"],
+        "remaining": summary["total_budget"] - summary["total_spent"],
+        "upcomingBills": summary["upcoming_bills"],
+        "overdueBills": summary["overdue_bills"],
         "month": current_month,
         "year": current_year
     }
@@ -68,25 +67,23 @@ async def get_dashboard_summary():
 async def get_spending_by_category():
     """Get spending by category for current month"""
     current_date = datetime.now()
-    current_month = current_date.month
-    current_year = current_date.year
-    
+    month_start, month_end = _month_bounds(current_date.year, current_date.month)
+
     sql = """
-        SELECT 
+        SELECT
             c.name,
             c.color,
             COALESCE(SUM(t.amount), 0) as total
         FROM categories c
         LEFT JOIN transactions t ON c.id = t.category_id
-            AND strftime('%m', t.date) = printf('%02d', ?)
-            AND strftime('%Y', t.date) = ?
+            AND t.date >= ? AND t.date < ?
         WHERE c.type = 'expense'
         GROUP BY c.id, c.name, c.color
         HAVING total > 0
         ORDER BY total DESC
     """
-    
-    spending = execute_query(sql, (current_month, str(current_year)))
+
+    spending = await aexecute_query(sql, (month_start, month_end))
     return spending
 
 
@@ -94,12 +91,14 @@ async def get_spending_by_category():
 async def get_recent_transactions(limit: int = 5):
     """Get recent transactions"""
     sql = """
-        SELECT t.*, c.name as category_name, c.type as category_type, c.color as category_color
+        SELECT t.id, t.amount, t.currency, t.category_id, t.description, t.date,
+               t.is_recurring, t.recurrence_interval,
+               c.name as category_name, c.type as category_type, c.color as category_color
         FROM transactions t
         LEFT JOIN categories c ON t.category_id = c.id
         ORDER BY t.date DESC, t.created_at DESC
         LIMIT ?
     """
     
-    transactions = execute_query(sql, (limit,))
+    transactions = await aexecute_query(sql, (limit,))
     return transactions
@@ -5,11 +5,37 @@ from fastapi import APIRouter, HTTPException
 from typing import List, Optional
 
 from models.schemas import Transaction, TransactionCreate, TransactionUpdate, MessageResponse, CategorySuggestionRequest, CategorySuggestion
-from database.db import execute_query, execute_insert, execute_update
+from database.db import aexecute_query, aexecute_insert, aexecute_update
 from services.ai_categorization_service import suggest_category
 
 router = APIRouter()
 
+# Columns the Transaction response model serializes; created_at is only
+# used for ordering (projection rationale in bills.py)
+TRANSACTION_COLUMNS = (
+    "t.id, t.amount, t.currency, t.category_id, t.description, t.date, "
+    "t.is_recurring, t.recurrence_interval"
+)
+
+# All eight precompiled filter variants, keyed by
+# (has_start, has_end, has_category); rationale in bills.py
+TRANSACTIONS_SQL = {
+    (has_start, has_end, has_category): (
+        f"SELECT {TRANSACTION_COLUMNS}, c.name as category_name, "
+        "c.type as category_type, c.color as category_color "
+        "FROM transactions t "
+        "LEFT JOIN categories c ON t.category_id = c.id "
+        "WHERE 1=1"
+        + (" AND t.date >= ?" if has_start else "")
+        + (" AND t.date <= ?" if has_end else "")
+        + (" AND t.category_id = ?" if has_category else "")
+        + " ORDER BY t.date DESC, t.created_at DESC"
+    )
+    for has_start in (False, True)
+    for has_end in (False, True)
+    for has_category in (False, True)
+}
+
 
 @router.post("/suggest-category", response_model=CategorySuggestion)
 async def suggest_transaction_category(request: CategorySuggestionRequest):
@@ -31,40 +57,24 @@ async def get_transactions(
     categoryId: Optional[int] = None
 ):
     """Get all transactions with optional filters"""
-    sql = """
-        SELECT t.*, c.name as category_name, c.type as category_type, c.color as category_color
-        FROM transactions t
-        LEFT JOIN categories c ON t.category_id = c.id
-        WHERE 1=1
-    """
-    params = []
-    
-    if startDate:
-        sql += " AND t.date >= ?"
-        params.append(startDate)
-    if endDate:
-        sql += " AND t.date <= ?"
-        params.append(endDate)
-    if categoryId:
-        sql += " AND t.category_id = ?"
-        params.append(categoryId)
-    
-    sql += " ORDER BY t.date DESC, t.created_at DESC"
-    
-    transactions = execute_query(sql, tuple(params))
+    # Canonical parameter order matches the variant's predicate order
+    params = tuple(p for p in (startDate, endDate, categoryId) if p)
+    sql = TRANSACTIONS_SQL[(bool(startDate), bool(endDate), bool(categoryId))]
+
+    transactions = await aexecute_query(sql, params)
     return transactions
 
 
 @router.get("/{transaction_id}", response_model=Transaction)
 async def get_transaction(transaction_id: int):
     """Get transaction by ID"""
-    sql = """
-        SELECT t.*, c.name as category_name, c.type as category_type
+    sql = f"""
+        SELECT {TRANSACTION_COLUMNS}, c.name as category_name, c.type as category_type
         FROM transactions t
         LEFT JOIN categories c ON t.category_id = c.id
         WHERE t.id = ?
     """
-    transaction = execute_query(sql, (transaction_id,), fetch_one=True)
+    transaction = await aexecute_query(sql, (transaction_id,), fetch_one=True)
     
     if not transaction:
         raise HTTPException(status_code=404, detail="Transaction not found")
@@ -79,19 +89,24 @@ async def create_transaction(transaction: TransactionCreate):
         INSERT INTO transactions (amount, currency, category_id, description, date, is_recurring, recurrence_interval)
         VALUES (?, ?, ?, ?, ?, ?, ?)
     """
-    transaction_id = execute_insert(
-        sql,
-        (
-            transaction.amount,
-            transaction.currency,
-            transaction.category_id,
-            transaction.description,
-            transaction.date,
-            transaction.is_recurring,
-            transaction.recurrence_interval
+    try:
+        transaction_id = await aexecute_insert(
+            sql,
+            (
+                transaction.amount,
+                transaction.currency,
+                transaction.category_id,
+                transaction.description,
+                transaction.date,
+                transaction.is_recurring,
+                transaction.recurrence_interval
+            )
         )
-    )
-    
+    except Exception as e:
+        if "FOREIGN KEY constraint failed" in str(e):
+            raise HTTPException(status_code=400, detail="Category does not exist")
+        raise HTTPException(status_code=500, detail=str(e))
+
     return {
         "id": transaction_id,
         "amount": transaction.amount,
@@ -112,20 +127,25 @@ async def update_transaction(transaction_id: int, transaction: TransactionUpdate
         SET amount = ?, currency = ?, category_id = ?, description = ?, date = ?, is_recurring = ?, recurrence_interval = ?
         WHERE id = ?
     """
-    rows_affected = execute_update(
-        sql,
-        (
-            transaction.amount,
-            transaction.currency,
-            transaction.category_id,
-            transaction.description,
-            transaction.date,
-            transaction.is_recurring,
-            transaction.recurrence_interval,
-            transaction_id
+    try:
+        rows_affected = await aexecute_update(
+            sql,
+            (
+                transaction.amount,
+                transaction.currency,
+                transaction.category_id,
+                transaction.description,
+                transaction.date,
+                transaction.is_recurring,
+                transaction.recurrence_interval,
+                transaction_id
+            )
         )
-    )
-    
+    except Exception as e:
+        if "FOREIGN KEY constraint failed" in str(e):
+            raise HTTPException(status_code=400, detail="Category does not exist")
+        raise HTTPException(status_code=500, detail=str(e))
+
     if rows_affected == 0:
         raise HTTPException(status_code=404, detail="Transaction not found")
     
@@ -145,7 +165,7 @@ async def update_transaction(transaction_id: int, transaction: TransactionUpdate
 async def delete_transaction(transaction_id: int):
     """Delete a transaction"""
     sql = "DELETE FROM transactions WHERE id = ?"
-    rows_affected = execute_update(sql, (transaction_id,))
+    rows_affected = await aexecute_update(sql, (transaction_id,))
     
     if rows_affected == 0:
         raise HTTPException(status_code=404, detail="Transaction not found")
@@ -3,10 +3,10 @@ AI Categorization Service using OpenAI
 """
 import os
 from openai import AsyncOpenAI
-import json
+import orjson
 import logfire
 
-from database.db import execute_query
+from services.category_cache import get_expense_categories
 
 # Initialize OpenAI client (handle missing API key gracefully)
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
@@ -32,18 +32,14 @@ async def suggest_category(description: str) -> dict:
     if not description or description.strip() == "":
         raise ValueError("Description is required for AI categorization")
     
-    # Get all available expense categories from the database
-    categories = execute_query(
-        "SELECT id, name, type FROM categories WHERE type = ? ORDER BY name",
-        ("expense",)
-    )
-    
+    # Expense categories (and their pre-joined names string for the
+    # prompt) come from the shared TTL cache, which the category CRUD
+    # endpoints invalidate on change
+    categories, category_names = get_expense_categories()
+
     if not categories or len(categories) == 0:
         raise ValueError("No expense categories found in database")
-    
-    # Create a list of category names for the AI
-    category_names = ", ".join([c["name"] for c in categories])
-    
+
     prompt = f"""You are a financial assistant helping categorize expenses. 
 
 Given the transaction description: "{description}"
@@ -64,7 +60,9 @@ Rules:
     
     try:
         with logfire.span("openai_categorization", description=description[:50]):
-            completion = await client.chat.completions.create(
+            # Streaming overlaps the network receive with event-loop work
+            # instead of blocking on the fully assembled completion
+            stream = await client.chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=[
                     {
@@ -78,19 +76,23 @@ Rules:
                 ],
                 temperature=0.3,
                 max_tokens=150,
-                response_format={"type": "json_object"}
+                response_format={"type": "json_object"},
+                stream=True
             )
+
+            parts = []
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+
+        response = "".join(parts)
+        parsed = orjson.loads(response)
         
-        response = completion.choices[0].message.content
-        parsed = json.loads(response)
-        
-        # Find the matching category from our database
-        matched_category = None
-        for cat in categories:
-            if cat["name"].lower() == parsed["category"].lower():
-                matched_category = cat
-                break
-        
+        # Find the matching category via a hashed lookup instead of a
+        # linear scan that re-lowers both names per comparison
+        by_name = {cat["name"].lower(): cat for cat in categories}
+        matched_category = by_name.get(parsed["category"].lower())
+
         if not matched_category:
             # Fallback to first category if no match found
             logfire.warn("No exact category match found, using fallback", 
@@ -0,0 +1,54 @@
+"""
+In-process TTL cache for the categories table
+
+Categories are seeded at init and change only through occasional admin
+edits, so every request re-reading them from SQLite (directly or via a
+LEFT JOIN) is wasted work. The cache holds the full ordered list plus an
+{id: (name, color)} lookup used to decorate bills/budgets rows in Python.
+"""
+import time
+
+from database.db import execute_query
+
+CACHE_TTL_SECONDS = 60
+
+_cache = {"expires": 0.0, "rows": None, "lookup": None, "expense": None, "expense_names": ""}
+
+
+def _refresh_if_stale():
+    now = time.monotonic()
+    if _cache["rows"] is None or now >= _cache["expires"]:
+        rows = execute_query("SELECT * FROM categories ORDER BY type, name")
+        _cache["rows"] = rows
+        _cache["lookup"] = {row["id"]: (row["name"], row["color"]) for row in rows}
+        expense = [row for row in rows if row["type"] == "expense"]
+        _cache["expense"] = expense
+        _cache["expense_names"] = ", ".join(row["name"] for row in expense)
+        _cache["expires"] = now + CACHE_TTL_SECONDS
+
+
+def get_categories_cached():
+    """Get all categories ordered by type then name (cached)"""
+    _refresh_if_stale()
+    return _cache["rows"]
+
+
+def get_category_lookup():
+    """Get an {id: (name, color)} dict for decorating rows in Python"""
+    _refresh_if_stale()
+    return _cache["lookup"]
+
+
+def get_expense_categories():
+    """Get the expense categories plus their names pre-joined for prompts"""
+    _refresh_if_stale()
+    return _cache["expense"], _cache["expense_names"]
+
+
+def invalidate_categories():
+    """Drop the cache after a category create/update/delete"""
+    _cache["rows"] = None
+    _cache["lookup"] = None
+    _cache["expense"] = None
+    _cache["expense_names"] = ""
+    _cache["expires"] = 0.0
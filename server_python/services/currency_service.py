@@ -2,16 +2,32 @@
 Currency Service for exchange rate management
 Fetches rates from BNR (Banca Națională a României) API
 """
+import asyncio
+import io
 import httpx
 import xml.etree.ElementTree as ET
 from datetime import datetime, date
 import logfire
 
-from database.db import execute_query, execute_insert, get_db
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # pragma: no cover - lxml is in requirements.txt
+    lxml_etree = None
+
+from database.db import execute_query, get_db
 
 # BNR API URL - provides daily exchange rates
 BNR_API_URL = "https://www.bnr.ro/nbrfxrates.xml"
 
+_BNR_NS = "{http://www.bnr.ro/xsd}"
+
+# In-process cache of the latest rates as (date_str, rates_dict). Rates
+# change at most once a day, so serving repeated /rates, /convert and
+# /currencies requests from memory skips a SQLite round-trip per call.
+# The lock coalesces concurrent misses into a single fetch.
+_rates_cache = None
+_rates_lock = asyncio.Lock()
+
 
 async def fetch_bnr_rates() -> dict:
     """
@@ -27,35 +43,54 @@ async def fetch_bnr_rates() -> dict:
                 )
                 response.raise_for_status()
             
-            # Parse XML response
-            root = ET.fromstring(response.text)
-            
-            # Find the Cube element
-            cube = root.find(".//{http://www.bnr.ro/xsd}Cube")
-            if cube is None:
-                raise ValueError("Invalid response format from BNR API")
-            
-            # Get date
-            rate_date = cube.get("date", datetime.now().strftime("%Y-%m-%d"))
-            
-            # Parse exchange rates
-            exchange_rates = {}
-            exchange_rates["RON"] = {"rate": 1.0, "date": rate_date}
-            
-            for rate_elem in cube.findall(".//{http://www.bnr.ro/xsd}Rate"):
-                currency_code = rate_elem.get("currency")
-                multiplier = int(rate_elem.get("multiplier", "1"))
-                rate_value = float(rate_elem.text)
-                
-                if currency_code and rate_value:
-                    # BNR gives rates as: 1 unit of foreign currency = X RON
-                    # If multiplier is present, it means: multiplier units = X RON
-                    # We need: 1 foreign currency = X/multiplier RON
-                    exchange_rates[currency_code] = {
-                        "rate": rate_value / multiplier,
-                        "date": rate_date
-                    }
-            
+            # Parse XML response. lxml (libxml2) streams straight over the
+            # Cube/Rate elements; the stdlib fallback builds the full tree.
+            rate_date = None
+            raw_rates = {}
+
+            if lxml_etree is not None:
+                tags = (f"{_BNR_NS}Cube", f"{_BNR_NS}Rate")
+                for _, elem in lxml_etree.iterparse(io.BytesIO(response.content), tag=tags):
+                    if elem.tag == tags[1]:
+                        currency_code = elem.get("currency")
+                        multiplier = int(elem.get("multiplier", "1"))
+                        rate_value = float(elem.text)
+                        if currency_code and rate_value:
+                            # BNR gives rates as: multiplier units = X RON,
+                            # we need: 1 foreign currency = X/multiplier RON
+                            raw_rates[currency_code] = rate_value / multiplier
+                    else:
+                        # Rate elements close before their Cube parent, so
+                        # the date arrives after the rates are collected
+                        rate_date = elem.get("date", datetime.now().strftime("%Y-%m-%d"))
+                        elem.clear()
+                if rate_date is None:
+                    raise ValueError("Invalid response format from BNR API")
+            else:
+                # Feed the raw bytes to the parser; response.text would
+                # charset-sniff and decode the payload only for the parser
+                # to re-encode it
+                root = ET.fromstring(response.content)
+
+                cube = root.find(f".//{_BNR_NS}Cube")
+                if cube is None:
+                    raise ValueError("Invalid response format from BNR API")
+
+                rate_date = cube.get("date", datetime.now().strftime("%Y-%m-%d"))
+
+                for rate_elem in cube.findall(f".//{_BNR_NS}Rate"):
+                    currency_code = rate_elem.get("currency")
+                    multiplier = int(rate_elem.get("multiplier", "1"))
+                    rate_value = float(rate_elem.text)
+
+                    if currency_code and rate_value:
+                        raw_rates[currency_code] = rate_value / multiplier
+
+            exchange_rates = {"RON": {"rate": 1.0, "date": rate_date}}
+            for currency_code, rate in raw_rates.items():
+                exchange_rates[currency_code] = {"rate": rate, "date": rate_date}
+
+
             logfire.info("BNR rates fetched successfully", 
                         date=rate_date, 
                         currency_count=len(exchange_rates))
@@ -66,20 +101,25 @@ async def fetch_bnr_rates() -> dict:
             raise Exception("Failed to fetch exchange rates from BNR")
 async def save_rates_to_database(rates: dict, rate_date: str):
     """Saves exchange rates to database"""
+    global _rates_cache
     with logfire.span("save_rates_to_database", rate_date=rate_date, count=len(rates)):
         with get_db() as conn:
-            cursor = conn.cursor()
-            
-            for currency, rate_value in rates.items():
-                cursor.execute(
-                    """INSERT OR REPLACE INTO exchange_rates (currency_code, rate, date)
-                       VALUES (?, ?, ?)""",
-                    (currency, rate_value["rate"], rate_date)
-                )
-            
+            # One executemany in a single transaction instead of ~30
+            # individual statements each paying their own round-trip
+            conn.executemany(
+                """INSERT OR REPLACE INTO exchange_rates (currency_code, rate, date)
+                   VALUES (?, ?, ?)""",
+                [(currency, value["rate"], rate_date) for currency, value in rates.items()]
+            )
             conn.commit()
-            logfire.info("Exchange rates saved to database", 
-                        date=rate_date, 
+
+            # Refresh the in-memory cache with the freshly saved snapshot
+            _rates_cache = (
+                rate_date,
+                {currency: value["rate"] for currency, value in rates.items()}
+            )
+            logfire.info("Exchange rates saved to database",
+                        date=rate_date,
                         currency_count=len(rates))
 
 
@@ -102,43 +142,69 @@ async def get_cached_rates(rate_date: str) -> dict:
 
 async def get_latest_rates() -> dict:
     """Gets the latest available exchange rates"""
-    with logfire.span("get_latest_rates"):
-        today = date.today().strftime("%Y-%m-%d")
-        
-        # Try to get today's rates from cache
-        cached = await get_cached_rates(today)
-        if cached:
-            logfire.info("Using cached exchange rates", date=today)
-            return {"rates": cached, "date": today, "source": "cache"}
-    
-    # Fetch fresh rates from BNR
-    try:
-        bnr_data = await fetch_bnr_rates()
-        exchange_rates = bnr_data["exchangeRates"]
-        rate_date = bnr_data["date"]
-        
-        await save_rates_to_database(exchange_rates, rate_date)
-        
-        rates = {currency: data["rate"] for currency, data in exchange_rates.items()}
-        return {"rates": rates, "date": rate_date, "source": "bnr"}
-        
-    except Exception as error:
-        # If fetch fails, try to get the most recent cached rates
-        rows = execute_query(
-            """SELECT currency_code, rate, date 
-               FROM exchange_rates 
-               WHERE date = (SELECT MAX(date) FROM exchange_rates)"""
-        )
-        
-        if not rows:
-            raise Exception("No exchange rates available")
-        
-        rates = {}
-        rate_date = rows[0]["date"]
-        for row in rows:
-            rates[row["currency_code"]] = row["rate"]
-        
-        return {"rates": rates, "date": rate_date, "source": "cache-fallback"}
+    global _rates_cache
+    today = date.today().strftime("%Y-%m-%d")
+
+    # Serve today's rates straight from memory without touching SQLite
+    if _rates_cache and _rates_cache[0] == today:
+        return {"rates": _rates_cache[1], "date": today, "source": "memory"}
+
+    async with _rates_lock:
+        # Another request may have filled the cache while we waited
+        if _rates_cache and _rates_cache[0] == today:
+            return {"rates": _rates_cache[1], "date": today, "source": "memory"}
+
+        with logfire.span("get_latest_rates"):
+            # Try to get today's rates from the database cache
+            cached = await get_cached_rates(today)
+            if cached:
+                logfire.info("Using cached exchange rates", date=today)
+                _rates_cache = (today, cached)
+                return {"rates": cached, "date": today, "source": "cache"}
+
+        # Fetch fresh rates from BNR
+        try:
+            bnr_data = await fetch_bnr_rates()
+            exchange_rates = bnr_data["exchangeRates"]
+            rate_date = bnr_data["date"]
+
+            await save_rates_to_database(exchange_rates, rate_date)
+
+            rates = {currency: data["rate"] for currency, data in exchange_rates.items()}
+            return {"rates": rates, "date": rate_date, "source": "bnr"}
+
+        except Exception as error:
+            # If fetch fails, try to get the most recent cached rates
+            rows = execute_query(
+                """SELECT currency_code, rate, date
+                   FROM exchange_rates
+                   WHERE date = (SELECT MAX(date) FROM exchange_rates)"""
+            )
+
+            if not rows:
+                raise Exception("No exchange rates available")
+
+            rates = {}
+            rate_date = rows[0]["date"]
+            for row in rows:
+                rates[row["currency_code"]] = row["rate"]
+
+            return {"rates": rates, "date": rate_date, "source": "cache-fallback"}
+
+
+# Inverse table memoized per rates snapshot (keyed by dict identity, so a
+# fresh snapshot from get_latest_rates invalidates it automatically)
+_inv_cache = (None, None)
+
+
+def _inverse_rates(rates: dict) -> dict:
+    """Get {code: 1/rate} for a rates snapshot, computed once per snapshot"""
+    global _inv_cache
+    cached_rates, inv = _inv_cache
+    if cached_rates is not rates:
+        inv = {code: 1.0 / rate for code, rate in rates.items()}
+        _inv_cache = (rates, inv)
+    return inv
 
 
 async def convert_currency(
@@ -159,36 +225,81 @@ async def convert_currency(
     Returns:
         Converted amount rounded to 2 decimals
     """
-    if from_currency == to_currency:
-        return amount
-    
+    # Normalize and short-circuit trivial conversions before any await,
+    # so no-op requests never cost a rates lookup
+    from_currency = from_currency.upper()
+    to_currency = to_currency.upper()
+    if amount == 0 or from_currency == to_currency:
+        return round(amount, 2)
+
     if rates is None:
         rates_data = await get_latest_rates()
         rates = rates_data["rates"]
-    
+
     if from_currency not in rates or to_currency not in rates:
         raise ValueError(f"Exchange rate not available for {from_currency} or {to_currency}")
-    
-    # Convert to RON first, then to target currency
-    amount_in_ron = amount * rates[from_currency]
-    converted_amount = amount_in_ron / rates[to_currency]
-    
-    return round(converted_amount, 2)
+
+    # Convert to RON first, then to target currency; multiplying by the
+    # precomputed inverse replaces a division per call
+    return round(amount * rates[from_currency] * _inverse_rates(rates)[to_currency], 2)
+
+
+async def convert_many(
+    amounts: list,
+    from_currencies: list,
+    to_currency: str,
+    rates: dict = None
+) -> list:
+    """
+    Converts a list of amounts (paired with their source currencies) to a
+    single target currency in one pass
+
+    Fetches the rates snapshot and resolves the target's inverse rate once,
+    so the per-row work is just two multiplications and a round — instead
+    of a convert_currency call (with its own rates lookup) per row.
+
+    No endpoint converts lists yet; like the transaction() helper in
+    database.db, this is groundwork for rendering transaction lists in the
+    user's display currency.
+    """
+    # Normalize codes the same way convert_currency does
+    to_currency = to_currency.upper()
+
+    if rates is None:
+        rates_data = await get_latest_rates()
+        rates = rates_data["rates"]
+
+    if to_currency not in rates:
+        raise ValueError(f"Exchange rate not available for {to_currency}")
+
+    inv_to = _inverse_rates(rates)[to_currency]
+    try:
+        return [
+            round(amount * rates[code.upper()] * inv_to, 2)
+            for amount, code in zip(amounts, from_currencies)
+        ]
+    except KeyError as missing:
+        raise ValueError(f"Exchange rate not available for {missing.args[0]}")
 
 
-async def update_exchange_rates() -> bool:
-    """Updates exchange rates (can be called by cron job)"""
+async def update_exchange_rates() -> dict:
+    """
+    Updates exchange rates (can be called by cron job)
+
+    Returns the fetched BNR payload on success (so callers can report the
+    date/currency count without a second fetch), or None on failure.
+    """
     with logfire.span("update_exchange_rates"):
         try:
             logfire.info("Updating exchange rates from BNR...")
             bnr_data = await fetch_bnr_rates()
             exchange_rates = bnr_data["exchangeRates"]
             rate_date = bnr_data["date"]
-            
+
             await save_rates_to_database(exchange_rates, rate_date)
             logfire.info("Exchange rates updated successfully", date=rate_date)
-            return True
-            
+            return bnr_data
+
         except Exception as error:
             logfire.error("Failed to update exchange rates", error=str(error))
-            return False
+            return None
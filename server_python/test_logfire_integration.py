@@ -2,6 +2,7 @@
 Test script to verify Logfire integration
 This script tests that Logfire is properly integrated and working
 """
+import importlib.util
 import sys
 import logfire
 from datetime import datetime
@@ -49,7 +50,7 @@ def test_logfire_spans():
 
 
 def test_imports():
-    """Test that all required modules can be imported"""
+    """Test that all required modules are installed"""
     print("\n🔍 Testing Module Imports...")
     modules = [
         "fastapi",
@@ -61,16 +62,17 @@ def test_imports():
         "apscheduler",
         "logfire"
     ]
-    
+
     all_imported = True
     for module_name in modules:
-        try:
-            __import__(module_name.split('.')[0])
+        # find_spec checks presence without actually importing, so heavy
+        # packages don't all get loaded just to verify they exist
+        if importlib.util.find_spec(module_name.split('.')[0]) is not None:
             print(f"  ✅ {module_name}")
-        except ImportError as e:
-            print(f"  ❌ {module_name}: {e}")
+        else:
+            print(f"  ❌ {module_name}: not installed")
             all_imported = False
-    
+
     return all_imported
 
 